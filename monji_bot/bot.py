@@ -1,22 +1,27 @@
 import asyncio
+import logging
+import re
+from typing import Optional
 
 import discord
 from discord.ext import commands
 from discord import app_commands
 
-from monji_bot.llm.commentary import generate_reply
+from monji_bot.llm.commentary import mention_reply_async
 from monji_bot.scramble.scramble_lifecycle import ask_next_scramble_round, end_scramble_game
 from monji_bot.scramble.scramble_manager import reset_scramble_session
-from monji_bot.trivia.constants import GAMES, EVENT_MENTION, KEY_TEXT, MODE_TRIVIA, MODE_SCRAMBLE, AUTO_RECORD_VC_ID, \
-    CRAIG_COMMAND_CHANNEL_ID
+from monji_bot.trivia.constants import ACTIVE_CHANNELS, GAMES, MODE_TRIVIA, MODE_SCRAMBLE, \
+    AUTO_RECORD_VC_ID, CRAIG_COMMAND_CHANNEL_ID
 from monji_bot.trivia.lifecycle import end_game, ask_next_round
 from monji_bot.trivia.resolution import resolve_round_winner
-from monji_bot.common.state import GameState, CorrectCandidate
+from monji_bot.common.state import GameState
 from .config import BOT_TOKEN
 from .db import init_schema, get_leaderboard, get_user_rank
 from .trivia.manager import reset_session_questions
 from .utils.fuzzy import is_correct_answer
 
+logger = logging.getLogger(__name__)
+
 intents = discord.Intents.default()
 intents.message_content = True
 intents.members = True
@@ -27,6 +32,22 @@ bot = commands.Bot(
     help_command=None,
 )
 
+# Both mention forms Discord may deliver (<@id> and the legacy <@!id>),
+# computed once in on_ready so on_message doesn't rebuild them per message.
+_BOT_MENTION_STRS: tuple[str, ...] = ()
+
+# Our own user id, cached in on_ready for cheap integer compares in on_message.
+_BOT_ID: int = 0
+
+# Strips both mention forms in one C-level pass; compiled in on_ready.
+_BOT_MENTION_RE: Optional[re.Pattern] = None
+
+# Embed titles are fixed per mode — build them once, not per /leaderboard call.
+_LB_TITLES = {
+    MODE_TRIVIA: f"🏆 {MODE_TRIVIA.capitalize()} Leaderboard",
+    MODE_SCRAMBLE: f"🏆 {MODE_SCRAMBLE.capitalize()} Leaderboard",
+}
+
 # -----------------------------
 # GAME START / STOP HELPERS
 # -----------------------------
@@ -39,16 +60,17 @@ async def start_game(
     ask_next_round,
     start_message: str,
 ):
-    if interaction.guild is None or interaction.channel is None:
+    # channel_id comes straight off the interaction payload; the channel
+    # object itself is only resolved once we actually need to send to it.
+    if interaction.guild is None or interaction.channel_id is None:
         await interaction.response.send_message(
             "I can only run games inside a server text channel.",
             ephemeral=True,
         )
         return
 
-    channel = interaction.channel
     guild_id = interaction.guild.id
-    key = (guild_id, channel.id)
+    key = (guild_id, interaction.channel_id)
 
     if rounds < 5 or rounds > 100:
         await interaction.response.send_message(
@@ -73,9 +95,10 @@ async def start_game(
     state.guild_id = guild_id
 
     GAMES[key] = state
+    ACTIVE_CHANNELS.add(interaction.channel_id)
 
     await interaction.response.send_message(start_message)
-    await ask_next_round(channel, state)
+    await ask_next_round(interaction.channel, state)
 
 
 async def stop_game(
@@ -84,15 +107,14 @@ async def stop_game(
     mode: str,
     end_game,
 ):
-    if interaction.guild is None or interaction.channel is None:
+    if interaction.guild is None or interaction.channel_id is None:
         await interaction.response.send_message(
             "This command can only be used in a server.",
             ephemeral=True,
         )
         return
 
-    channel = interaction.channel
-    key = (interaction.guild.id, channel.id)
+    key = (interaction.guild.id, interaction.channel_id)
 
     state = GAMES.get(key)
 
@@ -109,22 +131,40 @@ async def stop_game(
         f"⛔ **{mode.capitalize()} game stopped.**"
     )
 
-    await end_game(channel, state)
+    await end_game(interaction.channel, state)
 
 # -----------------------------
 # BOT EVENTS
 # -----------------------------
 @bot.event
 async def on_ready():
-    print(f"Logged in as {bot.user} (ID: {bot.user.id})")
+    global _BOT_MENTION_STRS, _BOT_ID, _BOT_MENTION_RE
+    _BOT_ID = bot.user.id
+    _BOT_MENTION_STRS = (f"<@{bot.user.id}>", f"<@!{bot.user.id}>")
+    _BOT_MENTION_RE = re.compile(rf"<@!?{bot.user.id}>")
+
+    logger.info("Logged in as %s (ID: %s)", bot.user, bot.user.id)
+
+    # On 3.12+ let tasks start eagerly: resolvers that begin with a cheap
+    # state check can run inline instead of taking a scheduler round-trip.
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+    # Schema init (DB round-trip) and command sync (Discord HTTP round-trip)
+    # are independent — overlap them so startup pays max() instead of sum().
+    schema_res, synced = await asyncio.gather(
+        init_schema(),
+        bot.tree.sync(),
+        return_exceptions=True,
+    )
 
-    await init_schema()
+    if isinstance(schema_res, Exception):
+        logger.error("Error initializing schema: %s", schema_res)
 
-    try:
-        synced = await bot.tree.sync()
-        print(f"✅ Synced {len(synced)} app commands.")
-    except Exception as e:
-        print(f"❌ Error syncing app commands: {e}")
+    if isinstance(synced, Exception):
+        logger.error("Error syncing app commands: %s", synced)
+    else:
+        logger.info("Synced %d app commands.", len(synced))
 
 # -----------------------------
 # COMMANDS
@@ -165,19 +205,64 @@ async def leaderboard(interaction: discord.Interaction, mode: app_commands.Choic
         )
         return
 
+    get_member = interaction.guild.get_member
+
+    # Hydrate uncached members with one gateway request instead of letting
+    # each row silently miss and fall back to the stored display name.
+    missing = [row["user_id"] for row in rows if get_member(row["user_id"]) is None]
+    if missing:
+        try:
+            await interaction.guild.query_members(user_ids=missing, cache=True)
+        except Exception:
+            pass  # fall back to DB display names below
+
     lines = []
     for idx, row in enumerate(rows, start=1):
-        member = interaction.guild.get_member(row["user_id"])
+        member = get_member(row["user_id"])
         name = member.display_name if member else row["display_name"] or f"<@{row['user_id']}>"
         lines.append(f"**#{idx}** — {name} — {row['score_total']} pts")
 
     await interaction.followup.send(
         embed=discord.Embed(
-            title=f"🏆 {mode.value.capitalize()} Leaderboard",
+            title=_LB_TITLES[mode.value],
             description="\n".join(lines),
         )
     )
 
+@bot.tree.command(name="leaderboard_me", description="Show your rank on the leaderboard.")
+@app_commands.choices(
+    mode=[
+        app_commands.Choice(name="Trivia", value=MODE_TRIVIA),
+        app_commands.Choice(name="Scramble", value=MODE_SCRAMBLE),
+    ]
+)
+async def leaderboard_me(interaction: discord.Interaction, mode: app_commands.Choice[str]):
+    if interaction.guild is None:
+        await interaction.response.send_message(
+            "This command can only be used in a server.",
+            ephemeral=True,
+        )
+        return
+
+    await interaction.response.defer(ephemeral=True)
+
+    result = await get_user_rank(
+        guild_id=interaction.guild.id,
+        user_id=interaction.user.id,
+        mode=mode.value,
+    )
+
+    if result is None:
+        await interaction.followup.send(
+            f"You're not on the **{mode.value}** leaderboard yet. Go win something."
+        )
+        return
+
+    rank, score = result
+    await interaction.followup.send(
+        f"📊 You're **#{rank}** on the {mode.value} leaderboard with **{score}** pts."
+    )
+
 @bot.tree.command(name="trivia", description="Start trivia.")
 async def trivia(interaction: discord.Interaction, rounds: int):
     await start_game(
@@ -219,9 +304,49 @@ async def scramble_stop(interaction: discord.Interaction):
 # -----------------------------
 # MESSAGE LISTENER
 # -----------------------------
+async def _check_trivia(user_answer: str, state: GameState) -> bool:
+    answers = state._answers
+    if not answers:
+        return False
+
+    answers_norm = state.current_question.get("answers_norm")
+    exact_re = state.current_question.get("exact_re")
+
+    if len(answers) > 3:
+        # Long alias lists make the fuzzy check CPU-heavy enough to
+        # stall the event loop during fast chat — push it to a thread.
+        return await asyncio.to_thread(
+            is_correct_answer, user_answer, answers, answers_norm, exact_re
+        )
+    return is_correct_answer(user_answer, answers, answers_norm, exact_re)
+
+
+async def _check_scramble(user_answer: str, state: GameState) -> bool:
+    return user_answer.casefold() == state._word_fold
+
+
+# One checker per game mode, looked up instead of an if/elif chain
+# so adding a mode doesn't grow the per-message branch count.
+_MODE_CHECKERS = {
+    MODE_TRIVIA: _check_trivia,
+    MODE_SCRAMBLE: _check_scramble,
+}
+
+
 @bot.event
 async def on_message(message: discord.Message):
-    if message.author.bot or message.guild is None:
+    if message.author.id == _BOT_ID or message.author.bot or message.guild is None:
+        return
+
+    # Bind the hot module globals to locals once; everything below runs
+    # per message, where LOAD_FAST beats repeated LOAD_GLOBAL.
+    content = message.content
+    mention_strs = _BOT_MENTION_STRS
+
+    # Fast path: no game running in this channel and no mention token in
+    # the raw content means there is nothing for us to do with this message.
+    if message.channel.id not in ACTIVE_CHANNELS and \
+            not any(m in content for m in mention_strs):
         return
 
     channel = message.channel
@@ -230,42 +355,44 @@ async def on_message(message: discord.Message):
 
     if game_state and game_state.in_progress and game_state.current_question:
         user_answer = message.content.strip()
-        is_correct = False
 
-        if game_state.mode == MODE_TRIVIA:
-            is_correct = is_correct_answer(
-                user_answer,
-                game_state.current_question["answers"],
-            )
-        elif game_state.mode == MODE_SCRAMBLE:
-            is_correct = user_answer.lower() == game_state.current_question["word"].lower()
+        checker = _MODE_CHECKERS.get(game_state.mode)
+        is_correct = (
+            await checker(user_answer, game_state) if checker else False
+        )
 
         if is_correct:
-            game_state.correct_candidates.append(CorrectCandidate(message=message))
-
-            if len(game_state.correct_candidates) == 1 and game_state.winner_id is None:
-                game_state.resolving = True
-                asyncio.create_task(
-                    resolve_round_winner(channel, game_state, game_state.round)
-                )
+            # Keep only the argmin by timestamp — resolution needs nothing
+            # but the earliest correct message.
+            earliest = game_state.earliest_correct
+            if earliest is None:
+                game_state.earliest_correct = message
+                if game_state.winner_id is None:
+                    game_state.resolving = True
+                    game_state.resolver_task = asyncio.ensure_future(
+                        resolve_round_winner(channel, game_state, game_state.round)
+                    )
+            elif message.created_at < earliest.created_at:
+                game_state.earliest_correct = message
 
-        await bot.process_commands(message)
         return
 
-    if bot.user and bot.user.mentioned_in(message):
-        content = message.content.replace(bot.user.mention, "").strip() or \
+    # raw_mentions parses ids straight out of the content — no user
+    # object resolution like mentioned_in does.
+    if _BOT_ID and _BOT_ID in message.raw_mentions:
+        if _BOT_MENTION_RE is not None:
+            content = _BOT_MENTION_RE.sub("", content)
+        content = content.strip() or \
                   "User mentioned you without saying anything. Respond sarcastically."
 
-        reply = await asyncio.to_thread(
-            generate_reply,
-            EVENT_MENTION,
-            {KEY_TEXT: content},
-        )
+        reply = await mention_reply_async(content)
         if reply:
             await channel.send(reply)
         return
 
-    await bot.process_commands(message)
+    # NOTE: no bot.process_commands here — every command is a slash command,
+    # so the prefix dispatcher has nothing to do. Re-add it if prefix
+    # commands ever come back.
 
 @bot.tree.command(name="about", description="About Monji.")
 async def about(interaction: discord.Interaction):
@@ -311,7 +438,13 @@ async def help_command(interaction: discord.Interaction):
 # ENTRY POINT
 # -----------------------------
 def main():
-    bot.run(BOT_TOKEN)
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    # log_handler=None: discord.py would otherwise attach its own root
+    # handler and double-print everything basicConfig already covers.
+    bot.run(BOT_TOKEN, log_handler=None)
 
 if __name__ == "__main__":
     main()
@@ -1,23 +1,23 @@
 # monji_bot/trivia/state.py
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+import asyncio
+from collections import Counter
+from dataclasses import dataclass
+from typing import List, Optional
 import random
 import discord
 
 
-@dataclass
-class CorrectCandidate:
-    message: discord.Message
-
-
-@dataclass
+# slots=True: these attributes are read on every message during a round,
+# so fixed-offset access (and no per-instance __dict__) pays off.
+@dataclass(slots=True)
 class GameState:
     round: int
     max_rounds: int
     current_question: Optional[dict]
     winner_id: Optional[int]
-    scores: Dict[int, int]
+    # Counter: score increments don't need a .get default dance.
+    scores: Counter
 
     in_progress: bool
     resolving: bool
@@ -25,8 +25,23 @@ class GameState:
 
     # NEW (optional but useful)
     mode: str = "trivia"
+    guild_id: Optional[int] = None
+
+    # Earliest correct message seen this round (argmin kept at insert
+    # time, so resolution doesn't need a candidate list at all).
+    earliest_correct: Optional[discord.Message] = None
+
+    # Held so the round's resolver can't be garbage-collected mid-flight.
+    resolver_task: Optional[asyncio.Task] = None
 
-    correct_candidates: List[CorrectCandidate] = field(default_factory=list)
+    # The round's hint/timeout task; kept so the next round can cancel a
+    # stale cycle instead of leaving it sleeping in the background.
+    hint_task: Optional[asyncio.Task] = None
+
+    # Hot-path snapshots of the active question, refreshed each round so
+    # on_message reads one attribute instead of chained dict lookups.
+    _answers: Optional[List[str]] = None
+    _word_fold: Optional[str] = None
 
     @classmethod
     def new(cls, max_rounds: int, mode: str = "trivia") -> "GameState":
@@ -35,7 +50,7 @@ class GameState:
             max_rounds=max_rounds,
             current_question=None,
             winner_id=None,
-            scores={},
+            scores=Counter(),
             in_progress=True,
             resolving=False,
             midgame_quip_done=False,
@@ -44,7 +59,7 @@ class GameState:
 
     def reset_round(self):
         self.winner_id = None
-        self.correct_candidates.clear()
+        self.earliest_correct = None
         self.resolving = False
 
     # -----------------------------
@@ -60,17 +75,16 @@ class GameState:
 
         letters = list(word)
 
-        scrambled = word
-        attempts = 0
-
-        # Ensure we don't return the original word
-        while scrambled == word and attempts < 10:
-            random.shuffle(letters)
-            scrambled = "".join(letters)
-            attempts += 1
-
-        # Fallback safety (extremely rare)
+        # One shuffle; if it lands back on the original, swap the first
+        # letter with any differing one — guaranteed to exist unless the
+        # word is a single repeated character.
+        random.shuffle(letters)
+        scrambled = "".join(letters)
         if scrambled == word:
-            scrambled = "".join(reversed(word))
+            for i in range(1, len(letters)):
+                if letters[i] != letters[0]:
+                    letters[0], letters[i] = letters[i], letters[0]
+                    scrambled = "".join(letters)
+                    break
 
         return scrambled
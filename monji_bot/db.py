@@ -1,12 +1,47 @@
 # monji_bot/db.py
 import asyncio
+import logging
+import time
 
 import asyncpg
 from typing import Optional
 from .config import DB_USER, DB_PASS, DB_NAME, DB_HOST, DB_PORT, DB_ENABLE_SSL
 
+logger = logging.getLogger(__name__)
+
 _pool: Optional[asyncpg.Pool] = None
 
+# ⭐ Leaderboard read cache: the top-N changes only when points are awarded,
+# so a short TTL absorbs repeated /leaderboard clicks between rounds.
+LB_CACHE_TTL = 30.0  # seconds
+
+_LB_CACHE: dict[tuple[int, str, int], tuple[float, list]] = {}
+
+# ⭐ Same idea for per-user rank lookups: keyed by (guild_id, user_id, mode).
+RANK_CACHE_TTL = 30.0  # seconds
+
+_RANK_CACHE: dict[tuple[int, int, str], tuple[float, Optional[tuple]]] = {}
+
+
+def invalidate_leaderboard(guild_id: int) -> None:
+    """Drop cached leaderboard rows for a guild (call after scores change)."""
+    for key in [k for k in _LB_CACHE if k[0] == guild_id]:
+        del _LB_CACHE[key]
+    # A score change shifts everyone's rank in the guild, not just the winner's.
+    for key in [k for k in _RANK_CACHE if k[0] == guild_id]:
+        del _RANK_CACHE[key]
+
+
+async def _warm_connection(conn: asyncpg.Connection) -> None:
+    """Parse the hot statements on every fresh connection (pool `init`),
+    so the first real query after a reconnect skips the prepare step."""
+    for sql in (_SQL_AWARD_POINTS, _SQL_GET_LEADERBOARD, _SQL_GET_USER_RANK):
+        try:
+            await conn.prepare(sql)
+        except asyncpg.PostgresError:
+            # First boot: the tables don't exist until init_schema runs.
+            return
+
 
 async def get_pool() -> asyncpg.Pool:
     global _pool
@@ -23,15 +58,32 @@ async def get_pool() -> asyncpg.Pool:
         host=DB_HOST,
         port=DB_PORT,
         ssl=DB_ENABLE_SSL,
+        # A couple of warm connections at idle, headroom for bursts, and
+        # a bounded statement cache so hot queries stay planned.
+        min_size=2,
+        max_size=20,
+        max_inactive_connection_lifetime=300,
+        statement_cache_size=256,
+        command_timeout=5.0,
+        init=_warm_connection,
     )
-    print("✅ Database pool created")
+    logger.info("Database pool created")
     return _pool
 
 
+# on_ready fires again on every gateway resume; the schema only needs
+# creating once per process.
+_schema_ready = False
+
+
 async def init_schema() -> None:
+    global _schema_ready
+    if _schema_ready:
+        return
+
     pool = await get_pool()
     async with pool.acquire() as conn:
-        # Existing questions table
+        # One multi-statement batch: a single round-trip for all the DDL.
         await conn.execute(
             """
             CREATE TABLE IF NOT EXISTS questions
@@ -53,9 +105,9 @@ async def init_schema() -> None:
                 NOT
                 NULL,
                 correct_answers
-                JSON,
+                JSONB,
                 incorrect_answers
-                JSON,
+                JSONB,
                 approved
                 BOOLEAN
                 DEFAULT
@@ -68,12 +120,27 @@ async def init_schema() -> None:
             ),
                 times_asked INTEGER DEFAULT 0
                 );
-            """
-        )
 
-        # ⭐ New: leaderboard storage
-        await conn.execute(
-            """
+            -- Upgrade pre-existing deployments that still carry plain
+            -- JSON columns (stored as text, reparsed on every read).
+            DO $$
+            BEGIN
+                IF EXISTS (SELECT 1
+                           FROM information_schema.columns
+                           WHERE table_name = 'questions'
+                             AND column_name = 'correct_answers'
+                             AND data_type = 'json') THEN
+                    ALTER TABLE questions
+                        ALTER COLUMN correct_answers TYPE JSONB
+                            USING correct_answers::jsonb,
+                        ALTER COLUMN incorrect_answers TYPE JSONB
+                            USING incorrect_answers::jsonb;
+                END IF;
+            END $$;
+
+            CREATE INDEX IF NOT EXISTS idx_questions_correct_answers_gin
+                ON questions USING GIN (correct_answers jsonb_path_ops);
+
             CREATE TABLE IF NOT EXISTS user_scores
             (
                 guild_id
@@ -106,12 +173,56 @@ async def init_schema() -> None:
                 user_id
             )
                 );
-            CREATE INDEX IF NOT EXISTS idx_user_scores_guild_score_desc
-                ON user_scores (guild_id, score_total DESC, last_updated ASC);
+            -- Covers the leaderboard query exactly: filter on
+            -- (guild_id, mode), ordered, with the selected columns in the
+            -- index so the LIMIT 10 is an index-only scan.
+            DROP INDEX IF EXISTS idx_user_scores_guild_score_desc;
+            CREATE INDEX IF NOT EXISTS idx_user_scores_guild_mode_score
+                ON user_scores (guild_id, mode, score_total DESC, last_updated ASC)
+                INCLUDE (user_id, display_name);
             """
         )
 
-        print("✅ Schema created / already existed")
+        _schema_ready = True
+        logger.info("Schema created / already existed")
+
+
+_SQL_AWARD_POINTS = """
+INSERT INTO user_scores (guild_id,
+                         user_id,
+                         mode,
+                         display_name,
+                         score_total,
+                         last_updated)
+VALUES ($1, $2, $3, $4, $5, NOW()) ON CONFLICT (guild_id, user_id, mode)
+DO
+UPDATE SET
+    score_total = user_scores.score_total + EXCLUDED.score_total,
+    display_name = EXCLUDED.display_name,
+    last_updated = NOW();
+"""
+
+_SQL_GET_LEADERBOARD = """
+SELECT user_id, display_name, score_total
+FROM user_scores
+WHERE guild_id = $1
+  AND mode = $2
+ORDER BY score_total DESC, last_updated ASC
+    LIMIT $3;
+"""
+
+_SQL_GET_USER_RANK = """
+SELECT rank, score_total
+FROM (SELECT user_id,
+             score_total,
+             RANK() OVER (
+            ORDER BY score_total DESC, last_updated ASC
+        ) AS rank
+      FROM user_scores
+      WHERE guild_id = $1
+        AND mode = $2) ranked
+WHERE user_id = $3;
+"""
 
 
 # ⭐ Award points to a user (mode-aware)
@@ -127,28 +238,71 @@ async def award_points(
         return
 
     pool = await get_pool()
-    async with pool.acquire() as conn:
-        await conn.execute(
-            """
-            INSERT INTO user_scores (guild_id,
-                                     user_id,
-                                     mode,
-                                     display_name,
-                                     score_total,
-                                     last_updated)
-            VALUES ($1, $2, $3, $4, $5, NOW()) ON CONFLICT (guild_id, user_id, mode)
-            DO
-            UPDATE SET
-                score_total = user_scores.score_total + EXCLUDED.score_total,
-                display_name = EXCLUDED.display_name,
-                last_updated = NOW();
-            """,
-            guild_id,
-            user_id,
-            mode,
-            display_name,
-            points,
-        )
+    await pool.execute(
+        _SQL_AWARD_POINTS,
+        guild_id,
+        user_id,
+        mode,
+        display_name,
+        points,
+    )
+
+    invalidate_leaderboard(guild_id)
+
+
+# ⭐ Scores accumulated in memory during a game and written out in one
+# batched statement, instead of one round-trip per round winner.
+_PENDING_POINTS: dict[tuple[int, int, str], tuple[int, str]] = {}
+
+
+def queue_points(
+        guild_id: int,
+        user_id: int,
+        display_name: str,
+        points: int,
+        mode: str,
+) -> None:
+    """Accumulate points in memory; flush_points() persists them."""
+    if points <= 0:
+        return
+
+    key = (guild_id, user_id, mode)
+    total, _ = _PENDING_POINTS.get(key, (0, display_name))
+    _PENDING_POINTS[key] = (total + points, display_name)
+
+
+async def flush_points(guild_id: Optional[int] = None) -> None:
+    """Write queued points in a single batched statement (all guilds by default)."""
+    if guild_id is None:
+        items = list(_PENDING_POINTS.items())
+        _PENDING_POINTS.clear()
+    else:
+        keys = [k for k in _PENDING_POINTS if k[0] == guild_id]
+        items = [(k, _PENDING_POINTS.pop(k)) for k in keys]
+
+    if not items:
+        return
+
+    await award_points_many(
+        [(g, u, m, name, pts) for (g, u, m), (pts, name) in items]
+    )
+
+
+async def award_points_many(
+        rows: list[tuple[int, int, str, str, int]],
+) -> None:
+    """
+    Persist many (guild_id, user_id, mode, display_name, points) rows in
+    one pipelined executemany instead of a round-trip per user.
+    """
+    if not rows:
+        return
+
+    pool = await get_pool()
+    await pool.executemany(_SQL_AWARD_POINTS, rows)
+
+    for g in {row[0] for row in rows}:
+        invalidate_leaderboard(g)
 
 
 # ⭐ New: get top N for a guild
@@ -158,21 +312,21 @@ async def get_leaderboard(
         mode: str,
         limit: int = 10,
 ):
+    key = (guild_id, mode, limit)
+    now = time.monotonic()
+
+    entry = _LB_CACHE.get(key)
+    if entry and now - entry[0] < LB_CACHE_TTL:
+        return entry[1]
+
     pool = await get_pool()
-    async with pool.acquire() as conn:
-        rows = await conn.fetch(
-            """
-            SELECT user_id, display_name, score_total
-            FROM user_scores
-            WHERE guild_id = $1
-              AND mode = $2
-            ORDER BY score_total DESC, last_updated ASC
-                LIMIT $3;
-            """,
-            guild_id,
-            mode,
-            limit,
-        )
+    rows = await pool.fetch(_SQL_GET_LEADERBOARD, guild_id, mode, limit)
+
+    # Keep the cache bounded: drop anything already past its TTL on insert.
+    for stale in [k for k, (ts, _) in _LB_CACHE.items() if now - ts >= LB_CACHE_TTL]:
+        del _LB_CACHE[stale]
+    _LB_CACHE[key] = (now, rows)
+
     return rows
 
 
@@ -182,30 +336,23 @@ async def get_user_rank(
         user_id: int,
         mode: str,
 ):
+    key = (guild_id, user_id, mode)
+    now = time.monotonic()
+
+    entry = _RANK_CACHE.get(key)
+    if entry and now - entry[0] < RANK_CACHE_TTL:
+        return entry[1]
+
     pool = await get_pool()
-    async with pool.acquire() as conn:
-        row = await conn.fetchrow(
-            """
-            SELECT rank, score_total
-            FROM (SELECT user_id,
-                         score_total,
-                         RANK() OVER (
-                        ORDER BY score_total DESC, last_updated ASC
-                    ) AS rank
-                  FROM user_scores
-                  WHERE guild_id = $1
-                    AND mode = $2) ranked
-            WHERE user_id = $3;
-            """,
-            guild_id,
-            mode,
-            user_id,
-        )
+    row = await pool.fetchrow(_SQL_GET_USER_RANK, guild_id, mode, user_id)
+
+    result = None if row is None else (row["rank"], row["score_total"])
 
-    if row is None:
-        return None
+    for stale in [k for k, (ts, _) in _RANK_CACHE.items() if now - ts >= RANK_CACHE_TTL]:
+        del _RANK_CACHE[stale]
+    _RANK_CACHE[key] = (now, result)
 
-    return row["rank"], row["score_total"]
+    return result
 
 
 # run init_schema only
@@ -1,151 +1,119 @@
 import asyncio
 import discord
 import json
-from openai import OpenAI
+import re
+import time
+from typing import Optional
+
+from openai import AsyncOpenAI
+
+# Optional C-backed JSON serializer for the per-call payloads; stdlib
+# json is the fallback when it isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from monji_bot.config import OPENAI_API_KEY
-from monji_bot.trivia.constants import EVENT_MID_ROUND_QUIP
+from monji_bot.trivia.constants import (
+    EVENT_HINT_3,
+    EVENT_MENTION,
+    EVENT_MID_ROUND_QUIP,
+    EVENT_NO_ANSWER,
+    KEY_TEXT,
+)
 from monji_bot.common.state import GameState
 
-client = OpenAI(api_key=OPENAI_API_KEY)
-
-SYSTEM_PROMPT = """
-You are Monji — a Discord trivia bot with a spicy personality.
-
-Personality summary:
-- Lively, quick-witted, cheeky — playful roast, never mean.
-- Dry sarcasm, clever one-liners, a bit of attitude.
-- Keep everything short, punchy, and entertaining.
-
-You will receive messages in this format:
-EVENT: <event_name>
-DATA: <JSON>
-
-EVENTS AND HOW TO BEHAVE:
-
----------------------------------------------------------------------------
-event="mention"
----------------------------------------------------------------------------
-- Tone: lively, spicy Monji — playful, witty, lightly sarcastic, never rude.
-- Treat DATA["text"] as a normal chat message.
-
-- ABSOLUTE HARD RULE:
-  You must NOT mention trivia, the trivia game, questions, answers, hints,
-  rounds, scoring, points, leaderboards, or anything game-related **unless the
-  user's message explicitly contains one of these keywords**:
-
-    ["trivia", "quiz", "question", "questions",
-     "hint", "hints", "answer", "answers",
-     "game", "round", "rounds", "score", "scores",
-     "points", "leaderboard"]
-
-  If the user message does NOT contain any of these words:
-    → behave as if trivia does not exist.
-    → no references to the game at all.
-
-- Never assume they are referring to the trivia game unless they clearly say so.
-- Keep responses short (1–3 sentences).
-- One emoji allowed rarely.
-
----------------------------------------------------------------------------
-event="hint_3"
----------------------------------------------------------------------------
-- This is a late-stage hint, but you MUST NOT mention hints, hint number,
-  difficulty, needing help, or anything meta about hinting.
-- DATA["question"] contains the question text; use ONLY the topic/theme.
-- DATA["answer"] contains the correct answer.
-
-HARD RESTRICTIONS:
-* DO NOT say or reference the answer directly.
-* DO NOT output any substring of the answer longer than 1 character.
-* DO NOT give structural clues:
-  - no “starts with”, “ends with”, “rhymes with”, “letter count”, patterns, etc.
-* DO NOT mention how many hints have been given.
-
-SOFT ALLOWANCES:
-* You MAY vaguely refer to the answer (“that city”, “that band”).
-* Must be very general and non-actionable.
-
-FORMAT RULES:
-* Exactly ONE short sentence.
-* Max ~15–18 words.
-* Topic-aware humor and sarcasm allowed.
-* Emoji optional (0 or 1).
-
----------------------------------------------------------------------------
-event="mid_round_quip"
----------------------------------------------------------------------------
-- Context: the trivia game is mid-round or just ended.
-- DATA includes: "round", "max_rounds", "scores" = list of {"display_name", "score"}.
-
-- When referring to a player, you MUST use the exact literal format:
-      @<display_name>
-  Example: "@Alice is cruising today."
-
-- HARD RULES FOR MENTIONS:
-  * You must output @DisplayName exactly as:
-        @ + the display_name string from DATA (no brackets, no quotes).
-  * Do NOT modify, stylize, or add punctuation inside the mention.
-  * You may place punctuation AFTER the mention (e.g. "@Alice, you're flying").
-  * You must NOT attach the @DisplayName to another word (e.g. no “hello@Alice”).
-  * You may include at most one mention, unless the LLM decides multiple are needed.
-  * You must NOT invent, change, shorten, or guess display names — only use DATA entries.
-
-- Your job:
-  * Produce ONE playful, spicy, sarcastic sentence (~≤25 words).
-  * Comment on the scoreboard vibe: who's leading, who’s closing in, etc.
-  * Never reveal or hint at correct answers.
-  * Emojis optional; max 1.
-
-- If you choose not to mention anyone, produce a normal quip with no @ signs.
-
----------------------------------------------------------------------------
-event="no_answer"
----------------------------------------------------------------------------
-- Time’s up; nobody answered correctly.
-- Caller prints the correct answer already.
-
-You must:
-- Return ONE short sarcastic sentence reacting to everyone missing it.
-- DO NOT restate the answer.
-- Keep it spicy but never insulting.
-
----------------------------------------------------------------------------
-event="default"
----------------------------------------------------------------------------
-- Normal, helpful, slightly spicy Monji.
-- Keep responses short unless detail is clearly requested.
-
----------------------------------------------------------------------------
-GLOBAL RULES
----------------------------------------------------------------------------
-- For all events EXCEPT "mid_round_quip", NEVER include @mentions.
-- Never reveal or hint at answers.
-- Never output any substring of the answer longer than 1 char (hint_3 only).
-- Keep replies concise; avoid long paragraphs.
-- Emojis rare; max 1.
-- If asked about your name, say:
-  "Monji comes from two Japanese kanji — '問' (mon) meaning 'to ask' and '字' (ji)
-   meaning 'character'. So yeah, my name literally means 'question character.'
-   Fitting, right?"
-   
----------------------------------------------------------------------------
-MODE AWARENESS
----------------------------------------------------------------------------
-- DATA["mode"] will be either "trivia" or "scramble".
-
-- If mode = "scramble":
-  * The challenge is a scrambled single English word.
-  * Do NOT reference trivia, facts, knowledge, or learning.
-  * Speak as if this is a pure word game.
-  * Reactions should feel like “you couldn’t crack the word”, not “you didn’t know it”.
-
-- If mode = "trivia":
-  * Normal trivia behavior applies.
+# Async client: requests ride the event loop's httpx transport directly,
+# no worker thread per call.
+client = AsyncOpenAI(api_key=OPENAI_API_KEY)
+
+# Cap on in-flight LLM calls: mention spam waits here instead of piling
+# concurrent requests onto the API. Sized so simultaneous quips across
+# many guilds overlap instead of queueing; the wait_for below bounds how
+# long any caller can be stuck on one reply.
+_LLM_SEM = asyncio.Semaphore(16)
+_LLM_TIMEOUT = 10.0
+
+# Compact rules table — every hard rule from the original long-form prompt
+# is preserved, just stated once. Keep edits additive and byte-stable: this
+# string is the cached prefix for every API call.
+SYSTEM_PROMPT = """\
+You are Monji, a Discord trivia bot: lively, cheeky, dry sarcasm, playful roast, never mean. Short and punchy.
+
+Input format: "EVENT: <name>\\nDATA: <JSON>".
+
+# mention
+Treat DATA["text"] as normal chat. 1-3 sentences.
+HARD RULE: never mention trivia/the game/questions/answers/hints/rounds/scores/points/leaderboards UNLESS the user's text contains one of: trivia, quiz, question(s), hint(s), answer(s), game, round(s), score(s), points, leaderboard. Otherwise act as if the game does not exist.
+
+# hint_3
+A late hint, but never say so — no meta about hints, hint count, difficulty, or needing help.
+DATA["question"] = question (use only its topic/theme); DATA["answer"] = correct answer.
+HARD: do not say the answer, output any substring of it longer than 1 character, or give structural clues (starts/ends with, rhymes, letter count, patterns).
+Allowed: vague non-actionable reference ("that city", "that band").
+Format: exactly ONE sentence, max ~15-18 words, topic-aware sarcasm fine.
+
+# mid_round_quip
+Game is mid-round. DATA: round, max_rounds, scores = [{display_name, score}].
+ONE playful sarcastic sentence (<=25 words) on the scoreboard vibe. Never reveal or hint at answers.
+Mention format, exact literal: "@" + display_name from DATA — no brackets/quotes, nothing changed inside it, punctuation only AFTER it, never glued to another word. Never invent, shorten, or guess names; usually at most one mention. Mentioning nobody is fine.
+
+# no_answer
+Time's up, nobody got it; the caller prints the answer. ONE short sarcastic sentence about everyone missing it — do NOT restate the answer.
+
+# default
+Normal, helpful, slightly spicy. Short unless detail is clearly requested.
+
+# global
+No @mentions in any event except mid_round_quip. Never reveal or hint at answers. Concise replies, no long paragraphs. Emojis rare, max 1.
+If asked about your name: "Monji comes from two Japanese kanji — '問' (mon) meaning 'to ask' and '字' (ji) meaning 'character'. So yeah, my name literally means 'question character.' Fitting, right?"
+
+# mode
+DATA["mode"] is "trivia" or "scramble". Scramble = unscrambling a single English word: no trivia/facts/knowledge talk; misses read as "couldn't crack the word", not "didn't know it". Trivia = normal behavior.
 """
 
-
-def generate_reply(event: str, data: dict | None = None) -> str:
+# Built once so every request starts with the byte-identical system
+# message: provider-side prompt caching keys on a stable prefix, and any
+# per-call interpolation here would break the cache hit.
+_SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+
+# Hints and mentions carry the answer-safety rules and free-form chat, so
+# they keep the stronger mini; one-sentence quips and no-answer jabs are
+# easy enough for the cheaper, faster model.
+_DEFAULT_MODEL = "gpt-4o-mini"
+MODEL_BY_EVENT = {
+    EVENT_HINT_3: "gpt-4.1-mini",
+    EVENT_MENTION: "gpt-4.1-mini",
+    EVENT_MID_ROUND_QUIP: "gpt-4o-mini",
+    EVENT_NO_ANSWER: "gpt-4o-mini",
+}
+
+# Output caps sized to each event's format rule (one sentence, ~25 words,
+# 1-3 sentences): generation time scales with tokens produced, and
+# anything past the cap would only get discarded downstream anyway.
+_DEFAULT_MAX_TOKENS = 80
+MAX_TOKENS_BY_EVENT = {
+    EVENT_HINT_3: 40,
+    EVENT_NO_ANSWER: 40,
+    EVENT_MID_ROUND_QUIP: 70,
+    EVENT_MENTION: 120,
+}
+
+# Sentence terminators followed by whitespace/end — used to cut the
+# mention stream once the 1-3 sentence budget is spent.
+_SENTENCE_END_RE = re.compile(r"[.!?](?=\s|$)")
+
+
+def _dumps(data: dict) -> str:
+    """Serialize an event payload: sorted keys so the same dict always
+    produces the same bytes (the reply cache keys on this string too)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS).decode()
+    return json.dumps(data, ensure_ascii=False, sort_keys=True)
+
+
+async def generate_reply(event: str, data: dict | None = None) -> str:
     """
     Generic LLM interface for Monji.
     event: "mention", "hint_3", "no_answer", "mid_round_quip", ...
@@ -154,17 +122,43 @@ def generate_reply(event: str, data: dict | None = None) -> str:
     if data is None:
         data = {}
 
-    payload = f"EVENT: {event}\nDATA: {json.dumps(data, ensure_ascii=False)}"
+    payload = f"EVENT: {event}\nDATA: {_dumps(data)}"
+
+    request = dict(
+        model=MODEL_BY_EVENT.get(event, _DEFAULT_MODEL),
+        messages=[
+            _SYSTEM_MESSAGE,
+            {"role": "user", "content": payload},
+        ],
+        max_tokens=MAX_TOKENS_BY_EVENT.get(event, _DEFAULT_MAX_TOKENS),
+        # A blank line means the model has started a new paragraph the
+        # spec forbids anyway — stop instead of paying for it.
+        stop=["\n\n"],
+        temperature=0.8,
+        timeout=10,
+    )
 
     try:
-        response = client.chat.completions.create(
-            model="gpt-4.1-mini",
-            messages=[
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {"role": "user", "content": payload},
-            ],
-            timeout=10,
-        )
+        # Mentions stream: the reply is usable at the third sentence end,
+        # so close the stream there instead of waiting out the tail.
+        if event == EVENT_MENTION:
+            stream = await client.chat.completions.create(stream=True, **request)
+            pieces: list[str] = []
+            sentence_ends = 0
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                pieces.append(delta)
+                sentence_ends += len(_SENTENCE_END_RE.findall(delta))
+                if sentence_ends >= 3:
+                    await stream.close()
+                    break
+            return "".join(pieces).strip()
+
+        response = await client.chat.completions.create(**request)
         return response.choices[0].message.content.strip()
 
     except Exception:
@@ -181,6 +175,80 @@ def generate_reply(event: str, data: dict | None = None) -> str:
         return ""
 
 
+# Reply cache: the same (event, data) payload builds the exact same
+# prompt, so repeated hint_3 questions and spam-pings can skip the API
+# round-trip entirely. Exact-match only, TTL'd like the db.py caches.
+REPLY_CACHE_TTL = 3600.0  # seconds
+_REPLY_CACHE_MAX = 1024
+_REPLY_CACHE: dict[tuple[str, str], tuple[float, str]] = {}
+
+
+def _cache_get(key: tuple[str, str]) -> Optional[str]:
+    entry = _REPLY_CACHE.get(key)
+    if entry and time.monotonic() - entry[0] < REPLY_CACHE_TTL:
+        return entry[1]
+    return None
+
+
+def _cache_put(key: tuple[str, str], reply: str) -> None:
+    now = time.monotonic()
+    for stale in [k for k, (ts, _) in _REPLY_CACHE.items() if now - ts >= REPLY_CACHE_TTL]:
+        del _REPLY_CACHE[stale]
+    if len(_REPLY_CACHE) >= _REPLY_CACHE_MAX:
+        _REPLY_CACHE.clear()
+    _REPLY_CACHE[key] = (now, reply)
+
+
+async def generate_reply_async(event: str, data: dict | None = None) -> str:
+    """generate_reply behind the reply cache, concurrency cap and deadline."""
+    key = None
+    # Quips react to the live scoreboard — too high-cardinality to cache.
+    if event != EVENT_MID_ROUND_QUIP:
+        key = (event, _dumps(data or {}))
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+
+    async with _LLM_SEM:
+        try:
+            reply = await asyncio.wait_for(
+                generate_reply(event, data),
+                timeout=_LLM_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            return ""
+
+    if reply and key is not None:
+        _cache_put(key, reply)
+
+    return reply
+
+
+async def mention_reply_async(content: str) -> str:
+    """Cached mention reply behind the concurrency cap and deadline."""
+    # Case-folded key so "Hi Monji" and "hi monji" share an entry; the
+    # raw content still goes to the model on a miss.
+    key = (EVENT_MENTION, content.strip().lower()[:200])
+
+    reply = _cache_get(key)
+    if reply is not None:
+        return reply
+
+    async with _LLM_SEM:
+        try:
+            reply = await asyncio.wait_for(
+                generate_reply(EVENT_MENTION, {KEY_TEXT: content}),
+                timeout=_LLM_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            return "I'm having a moment. Try again in a sec."
+
+    if reply:
+        _cache_put(key, reply)
+
+    return reply
+
+
 async def handle_midgame_quip(channel: discord.TextChannel, state: GameState):
     guild = channel.guild
     if guild is None:
@@ -210,21 +278,26 @@ async def handle_midgame_quip(channel: discord.TextChannel, state: GameState):
         ],
     }
 
-    # LLM call (sync function in a thread)
-    text = await asyncio.to_thread(
-        generate_reply,
-        EVENT_MID_ROUND_QUIP,
-        data,
-    )
+    # LLM call on the bounded executor
+    text = await generate_reply_async(EVENT_MID_ROUND_QUIP, data)
 
     if not text:
         return
 
-    # Replace ALL @display_name occurrences with real Discord mentions
-    for member, _ in players:
-        placeholder = f"@{member.display_name}"
-        if placeholder in text:
-            text = text.replace(placeholder, member.mention)
+    # Replace ALL @display_name occurrences with real Discord mentions in
+    # one scan instead of one pass (and string copy) per player. Longest
+    # names first so a name that prefixes another can't steal its match.
+    if "@" in text:
+        mention_map = {m.display_name: m.mention for m, _ in players}
+        pattern = re.compile(
+            "@("
+            + "|".join(
+                re.escape(name)
+                for name in sorted(mention_map, key=len, reverse=True)
+            )
+            + ")"
+        )
+        text = pattern.sub(lambda mo: mention_map[mo.group(1)], text)
 
     # Optional: clamp length
     if len(text) > 200:
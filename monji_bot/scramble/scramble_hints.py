@@ -103,7 +103,7 @@ async def handle_scramble_timeout(
 
     # Lock the round: no winner
     state.winner_id = -1
-    state.correct_candidates.clear()
+    state.earliest_correct = None
 
     await channel.send(
         f"⏰ Time’s up! The correct word was **{word.upper()}**."
@@ -1,19 +1,36 @@
 import asyncio
+import heapq
+import operator
+
 import discord
 
 from monji_bot.scramble.scramble_hints import handle_scramble_timeout
 from monji_bot.scramble.scramble_manager import get_random_scramble_word
 from monji_bot.llm.commentary import handle_midgame_quip
 from monji_bot.common.state import GameState
-
-
-async def ask_next_scramble_round(channel: discord.TextChannel, state: GameState):
-    """Ask the next scramble word."""
+from monji_bot.db import flush_points
+from monji_bot.trivia.constants import ACTIVE_CHANNELS
+
+
+async def ask_next_scramble_round(
+    channel: discord.TextChannel,
+    state: GameState,
+    pre_text: str | None = None,
+):
+    """
+    Ask the next scramble word.
+
+    `pre_text` (e.g. the winner line from the previous round) is folded
+    into the round message so the transition costs one send.
+    """
+    prefix = f"{pre_text}\n\n" if pre_text else ""
     row = await get_random_scramble_word(channel.guild.id)
     if row is None:
-        await channel.send("I ran out of scramble words. This is awkward.")
+        await channel.send(prefix + "I ran out of scramble words. This is awkward.")
         state.in_progress = False
         state.current_question = None
+        ACTIVE_CHANNELS.discard(channel.id)
+        await flush_points(state.guild_id)
         return
 
     state.round += 1
@@ -24,11 +41,13 @@ async def ask_next_scramble_round(channel: discord.TextChannel, state: GameState
 
     state.current_question = {
         "word": word,
+        "word_fold": word.casefold(),  # computed once; checked per message
         "scrambled": scrambled,
     }
+    state._word_fold = state.current_question["word_fold"]
 
     await channel.send(
-        f"🔀 **Scramble {state.round} of {state.max_rounds}**\n\n"
+        f"{prefix}🔀 **Scramble {state.round} of {state.max_rounds}**\n\n"
         f"**{scrambled.upper()}**\n\n"
         f"⏱️ You have **60 seconds**. Go."
     )
@@ -42,15 +61,28 @@ async def ask_next_scramble_round(channel: discord.TextChannel, state: GameState
             else:
                 await ask_next_scramble_round(channel, state)
 
-    asyncio.create_task(run_timeout_flow())
+    prev = state.hint_task
+    if prev is not None and not prev.done() and prev is not asyncio.current_task():
+        prev.cancel()
+    state.hint_task = asyncio.create_task(run_timeout_flow())
 
 
 async def end_scramble_game(channel: discord.TextChannel, state: GameState):
     """End scramble game and show scoreboard."""
     state.in_progress = False
     state.current_question = None
-    state.correct_candidates.clear()
+    state.earliest_correct = None
     state.resolving = False
+    ACTIVE_CHANNELS.discard(channel.id)
+
+    # Stop a still-sleeping hint cycle (unless we're running inside it).
+    task = state.hint_task
+    if task is not None and not task.done() and task is not asyncio.current_task():
+        task.cancel()
+    state.hint_task = None
+
+    # Persist everything the game queued up in one batched write.
+    await flush_points(state.guild_id)
 
     scores = state.scores
     if not scores:
@@ -59,22 +91,30 @@ async def end_scramble_game(channel: discord.TextChannel, state: GameState):
         )
         return
 
-    sorted_scores = sorted(
-        scores.items(),
-        key=lambda kv: kv[1],
-        reverse=True,
-    )
+    # Only the top 10 are shown, so pick them in O(n) instead of a full sort.
+    sorted_scores = heapq.nlargest(10, scores.items(), key=operator.itemgetter(1))
+    header = "🔀 **Scramble over.** Final scores"
+    if len(scores) > 10:
+        header += " (top 10)"
 
-    lines = []
     guild = channel.guild
-
-    for i, (user_id, score) in enumerate(sorted_scores, start=1):
-        member = guild.get_member(user_id) if guild else None
-        name = member.display_name if member else f"User {user_id}"
-        lines.append(f"**{i}. {name}** — {score} point(s)")
-
-    await channel.send(
-        "🔀 **Scramble over.** Final scores:\n" + "\n".join(lines)
-    )
+    get_member = guild.get_member if guild else (lambda _uid: None)
+
+    # Hydrate uncached players with one gateway request instead of
+    # falling back to "User <id>" per row.
+    missing = [uid for uid, _ in sorted_scores if get_member(uid) is None]
+    if missing and guild:
+        try:
+            await guild.query_members(user_ids=missing, cache=True)
+        except (discord.HTTPException, asyncio.TimeoutError):
+            pass  # names fall back to the id form below
+
+    lines = [
+        f"**{i}. {m.display_name if (m := get_member(user_id)) else f'User {user_id}'}**"
+        f" — {score} point(s)"
+        for i, (user_id, score) in enumerate(sorted_scores, start=1)
+    ]
+
+    await channel.send(header + ":\n" + "\n".join(lines))
 
     await handle_midgame_quip(channel, state)
@@ -13,7 +13,10 @@ HINT_DELAY_SECONDS = 25
 HINT_INTERVAL_SECONDS = 20
 FINAL_WAIT_SECONDS = 10
 WINNER_RESOLUTION_DELAY = 0.8
-ROUND_TRANSITION_DELAY = 1.0
+# Breather between a resolved round and the next question. Kept short:
+# the winner line rides on the next question's message anyway, and every
+# extra second here is idle wall-clock multiplied by max_rounds.
+ROUND_TRANSITION_DELAY = 0.5
 
 # -----------------------------
 # CRAIG AUTO-RECORD CONFIG
@@ -26,3 +29,7 @@ MODE_TRIVIA = "trivia"
 MODE_SCRAMBLE = "scramble"
 
 GAMES: dict[int, GameState] = {}
+
+# Channel ids with a running game — lets on_message bail with one set
+# membership test instead of building a (guild, channel) key per message.
+ACTIVE_CHANNELS: set[int] = set()
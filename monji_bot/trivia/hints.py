@@ -3,7 +3,7 @@
 import asyncio
 import discord
 
-from monji_bot.llm.commentary import generate_reply
+from monji_bot.llm.commentary import generate_reply_async
 from monji_bot.trivia.constants import (
     HINT_DELAY_SECONDS,
     HINT_INTERVAL_SECONDS,
@@ -16,6 +16,11 @@ from monji_bot.trivia.constants import (
 from monji_bot.common.state import GameState
 
 
+# One bullet buffer built at import; build_hint slices it instead of
+# constructing a fresh "•" * k string per word per call.
+_BULLETS = "•" * 256
+
+
 def build_hint(answer: str, level: int) -> str:
     words = answer.split()
     hints = []
@@ -38,9 +43,11 @@ def build_hint(answer: str, level: int) -> str:
             else:
                 show = max(1, (3 * length) // 4)
 
-        visible = w[:show]
-        hidden = "•" * (length - show)
-        hints.append(visible + hidden)
+        hidden = length - show
+        if hidden <= len(_BULLETS):
+            hints.append(w[:show] + _BULLETS[:hidden])
+        else:
+            hints.append(w[:show] + "•" * hidden)
 
     return " ".join(hints)
 
@@ -69,7 +76,7 @@ async def handle_game_question_timeout(
         answers = q.get("answers") or []
         if not answers:
             return None
-        main_answer = answers[0]
+        main_answer = q.get("main_answer") or answers[0]
 
     elif state.mode == "scramble":
         main_answer = q.get("word")
@@ -81,18 +88,31 @@ async def handle_game_question_timeout(
         return None
     # ---------------------------
 
-    single_char_answer = any(len(a.strip()) == 1 for a in answers)
+    single_char = q.get("single_char")
+    single_char_answer = (
+        single_char
+        if single_char is not None
+        else any(len(a.strip()) == 1 for a in answers)
+    )
+    main_answer_lower = q.get("main_answer_lower") or main_answer.lower()
+    # All three hint strings, when precomputed at round setup (trivia).
+    hint_texts = q.get("_hints")
 
     # Initial delay
     await asyncio.sleep(HINT_DELAY_SECONDS)
 
-    # Hints 1–3
+    # Hints 1–3. The hint-3 sarcasm is requested during the interval
+    # before hint 3 so its latency hides behind the sleep.
+    hint3_task = None
+
     for level in range(1, 4):
         if (
             not state.in_progress
             or state.winner_id is not None
             or state.round != this_round
         ):
+            if hint3_task is not None:
+                hint3_task.cancel()
             return None
 
         if single_char_answer:
@@ -100,30 +120,25 @@ async def handle_game_question_timeout(
                 f"💡 **Hint {level}/3:** `No hints for single-character answers.`"
             )
         else:
-            hint_text = build_hint(main_answer, level)
+            hint_text = (
+                hint_texts[level - 1] if hint_texts else build_hint(main_answer, level)
+            )
 
             if level < 3:
                 await channel.send(
                     f"💡 **Hint {level}/3:** `{hint_text}`"
                 )
             else:
-                data = {
-                    KEY_HINT: hint_text,
-                    "mode": state.mode,
-                    "answer": main_answer,
-                    "round": this_round,
-                    "max_rounds": state.max_rounds,
-                    "question": q.get("question"),
-                }
-
-                sarcasm = await asyncio.to_thread(
-                    generate_reply,
-                    EVENT_HINT_3,
-                    data,
-                )
+                if hint3_task is not None:
+                    try:
+                        sarcasm = await asyncio.wait_for(hint3_task, timeout=0.5)
+                    except asyncio.TimeoutError:
+                        sarcasm = None
+                else:
+                    sarcasm = None
 
                 if sarcasm:
-                    if main_answer.lower() in sarcasm.lower():
+                    if main_answer_lower in sarcasm.lower():
                         sarcasm = "Yeah… that was dangerously close."
                     if len(sarcasm) > 200:
                         sarcasm = sarcasm[:200]
@@ -137,38 +152,65 @@ async def handle_game_question_timeout(
                     )
 
         if level < 3:
-            await asyncio.sleep(HINT_INTERVAL_SECONDS)
+            if level == 2 and not single_char_answer:
+                data = {
+                    KEY_HINT: hint_texts[2] if hint_texts else build_hint(main_answer, 3),
+                    "mode": state.mode,
+                    "answer": main_answer,
+                    "round": this_round,
+                    "max_rounds": state.max_rounds,
+                    "question": q.get("question"),
+                }
+                hint3_task = asyncio.create_task(
+                    generate_reply_async(EVENT_HINT_3, data)
+                )
+            try:
+                await asyncio.sleep(HINT_INTERVAL_SECONDS)
+            except asyncio.CancelledError:
+                # Round resolved and the cycle got cancelled mid-sleep;
+                # don't leave the sarcasm task running for nobody.
+                if hint3_task is not None:
+                    hint3_task.cancel()
+                raise
+
+    # Final wait. Start the no-answer sarcasm now so the LLM works while
+    # we wait; if the round gets answered instead, the task is cancelled.
+    data = {
+        "mode": state.mode,
+        "answer": main_answer,
+        "round": this_round,
+        "max_rounds": state.max_rounds,
+        "question": q.get("question"),
+    }
+    no_answer_task = asyncio.create_task(
+        generate_reply_async(EVENT_NO_ANSWER, data)
+    )
 
-    # Final wait
-    await asyncio.sleep(FINAL_WAIT_SECONDS)
+    try:
+        await asyncio.sleep(FINAL_WAIT_SECONDS)
 
-    if state.resolving:
-        await asyncio.sleep(WINNER_RESOLUTION_DELAY + 0.1)
+        if state.resolving:
+            await asyncio.sleep(WINNER_RESOLUTION_DELAY + 0.1)
+    except asyncio.CancelledError:
+        no_answer_task.cancel()
+        raise
 
     if (
         not state.in_progress
         or state.winner_id is not None
         or state.round != this_round
     ):
+        no_answer_task.cancel()
         return None
 
     # Time’s up
     state.winner_id = -1
-    state.correct_candidates.clear()
-
-    data = {
-        "mode": state.mode,
-        "answer": main_answer,
-        "round": this_round,
-        "max_rounds": state.max_rounds,
-        "question": q.get("question"),
-    }
+    state.earliest_correct = None
 
-    sarcasm = await asyncio.to_thread(
-        generate_reply,
-        EVENT_NO_ANSWER,
-        data,
-    )
+    try:
+        sarcasm = await asyncio.wait_for(no_answer_task, timeout=0.5)
+    except asyncio.TimeoutError:
+        sarcasm = None
 
     if sarcasm:
         if len(sarcasm) > 200:
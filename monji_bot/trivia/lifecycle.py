@@ -2,31 +2,62 @@
 # MULTI-ROUND HELPERS
 # -----------------------------
 import asyncio
+import heapq
+import operator
+
 import discord
 
 from monji_bot.llm.commentary import handle_midgame_quip
-from monji_bot.trivia.hints import handle_game_question_timeout
+from monji_bot.trivia.hints import build_hint, handle_game_question_timeout
 from monji_bot.trivia.manager import get_random_question
 from monji_bot.common.state import GameState
-
-
-async def ask_next_round(channel: discord.TextChannel, state: GameState):
-    """Ask the next question in a multi-round game."""
+from monji_bot.db import flush_points
+from monji_bot.trivia.constants import ACTIVE_CHANNELS
+from monji_bot.utils.fuzzy import compile_exact_answers, prepare_answers
+
+
+async def ask_next_round(
+    channel: discord.TextChannel,
+    state: GameState,
+    pre_text: str | None = None,
+):
+    """
+    Ask the next question in a multi-round game.
+
+    `pre_text` (e.g. the winner line from the previous round) is folded
+    into the question message so the round transition costs one send.
+    """
+    prefix = f"{pre_text}\n\n" if pre_text else ""
     q = await get_random_question(channel.guild.id)
     if q is None:
         await channel.send(
-            "I ran out of questions. Blame whoever configured me."
+            prefix + "I ran out of questions. Blame whoever configured me."
         )
         state.in_progress = False
         state.current_question = None
+        ACTIVE_CHANNELS.discard(channel.id)
+        await flush_points(state.guild_id)
         return
 
     state.round += 1
     state.current_question = q
+    q["answers_norm"] = prepare_answers(q["answers"])
+    q["exact_re"] = compile_exact_answers(q["answers_norm"])
+    # Round-constant values the hint cycle reads; computed here once
+    # instead of inside handle_game_question_timeout.
+    q["main_answer"] = q["answers"][0]
+    q["main_answer_lower"] = q["main_answer"].lower()
+    q["single_char"] = any(len(a.strip()) == 1 for a in q["answers"])
+    q["_hints"] = (
+        []
+        if q["single_char"]
+        else [build_hint(q["main_answer"], level) for level in (1, 2, 3)]
+    )
+    state._answers = q["answers"]
     state.reset_round()
 
     await channel.send(
-        f"❓ **Question {state.round} of {state.max_rounds}**\n"
+        f"{prefix}❓ **Question {state.round} of {state.max_rounds}**\n"
         f"{q['question']}\n\n"
     )
 
@@ -47,16 +78,32 @@ async def ask_next_round(channel: discord.TextChannel, state: GameState):
             else:
                 await ask_next_round(channel, state)
 
-    # Start the hint / timeout cycle for this round
-    asyncio.create_task(run_timeout_flow())
+    # Start the hint / timeout cycle for this round. A stale cycle from a
+    # previous round is cancelled rather than left sleeping to completion.
+    # (On the timeout path this coroutine runs *inside* hint_task, so never
+    # cancel the current task.)
+    prev = state.hint_task
+    if prev is not None and not prev.done() and prev is not asyncio.current_task():
+        prev.cancel()
+    state.hint_task = asyncio.create_task(run_timeout_flow())
 
 
 async def end_game(channel: discord.TextChannel, state: GameState):
     """End the multi-round game and show the scoreboard."""
     state.in_progress = False
     state.current_question = None
-    state.correct_candidates.clear()
+    state.earliest_correct = None
     state.resolving = False
+    ACTIVE_CHANNELS.discard(channel.id)
+
+    # Stop a still-sleeping hint cycle (unless we're running inside it).
+    task = state.hint_task
+    if task is not None and not task.done() and task is not asyncio.current_task():
+        task.cancel()
+    state.hint_task = None
+
+    # Persist everything the game queued up in one batched write.
+    await flush_points(state.guild_id)
 
     scores = state.scores
 
@@ -66,22 +113,31 @@ async def end_game(channel: discord.TextChannel, state: GameState):
         )
         return
 
-    # Sort by score descending
-    sorted_scores = sorted(
-        scores.items(),
-        key=lambda kv: kv[1],
-        reverse=True,
-    )
+    # Only the top 10 are shown, so pick them in O(n) instead of a full sort.
+    sorted_scores = heapq.nlargest(10, scores.items(), key=operator.itemgetter(1))
+    header = "🎮 **Game over.** Here’s the damage"
+    if len(scores) > 10:
+        header += " (top 10)"
 
-    lines = []
     guild = channel.guild
-
-    for i, (user_id, score) in enumerate(sorted_scores, start=1):
-        member = guild.get_member(user_id) if guild else None
-        name = member.display_name if member else f"User {user_id}"
-        lines.append(f"**{i}. {name}** — {score} point(s)")
-
-    msg = "🎮 **Game over.** Here’s the damage:\n" + "\n".join(lines)
+    get_member = guild.get_member if guild else (lambda _uid: None)
+
+    # Hydrate uncached players with one gateway request instead of
+    # falling back to "User <id>" per row.
+    missing = [uid for uid, _ in sorted_scores if get_member(uid) is None]
+    if missing and guild:
+        try:
+            await guild.query_members(user_ids=missing, cache=True)
+        except (discord.HTTPException, asyncio.TimeoutError):
+            pass  # names fall back to the id form below
+
+    lines = [
+        f"**{i}. {m.display_name if (m := get_member(user_id)) else f'User {user_id}'}**"
+        f" — {score} point(s)"
+        for i, (user_id, score) in enumerate(sorted_scores, start=1)
+    ]
+
+    msg = header + ":\n" + "\n".join(lines)
     await channel.send(msg)
 
     # Extra LLM commentary based on final scores
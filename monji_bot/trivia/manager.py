@@ -3,7 +3,8 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-from typing import Any, Dict, List, Optional
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
 
 from ..db import get_pool
 
@@ -13,12 +14,18 @@ Question = Dict[str, Any]
 
 _question_lock = asyncio.Lock()
 
+# How many questions to pull per guild in one round-trip. Prefetched rows
+# are marked as used up front so concurrent games can't hand them out twice.
+PREFETCH_BATCH = 8
+
+_Q_CACHE: Dict[int, Deque[Question]] = {}
+
 # -----------------------------
 # SQL
 # -----------------------------
 
-# 1️⃣ Pick an UNUSED question for this guild
-_SQL_PICK_UNUSED = """
+# 1️⃣ Pick a batch of UNUSED questions for this guild
+_SQL_PICK_UNUSED_BATCH = """
 SELECT q.id, q.question, q.correct_answers
 FROM questions q
 WHERE q.approved = TRUE
@@ -29,7 +36,7 @@ WHERE q.approved = TRUE
       AND u.question_id = q.id
   )
 ORDER BY RANDOM()
-LIMIT 1
+LIMIT $2
 FOR UPDATE SKIP LOCKED
 """
 
@@ -43,10 +50,10 @@ LIMIT 1
 FOR UPDATE SKIP LOCKED
 """
 
-_SQL_INCREMENT_GLOBAL = """
+_SQL_INCREMENT_GLOBAL_MANY = """
 UPDATE questions
 SET times_asked = times_asked + 1
-WHERE id = $1
+WHERE id = ANY($1)
 """
 
 _SQL_INCREMENT_GUILD = """
@@ -59,12 +66,15 @@ DO UPDATE SET
 """
 
 # -----------------------------
-# Compatibility (kept)
+# Session handling
 # -----------------------------
 
-def reset_session_questions(*args, **kwargs) -> None:
-    # No session state anymore — kept to avoid breaking imports
-    return
+def reset_session_questions(guild_id: Optional[int] = None, *args, **kwargs) -> None:
+    """Drop prefetched questions for a guild (or all guilds) at game start."""
+    if guild_id is None:
+        _Q_CACHE.clear()
+    else:
+        _Q_CACHE.pop(guild_id, None)
 
 
 def stats_summary() -> Dict[str, int]:
@@ -94,35 +104,52 @@ def _parse_answers(raw: Any) -> List[str]:
 # -----------------------------
 
 async def get_random_question(guild_id: int) -> Optional[Question]:
+    # Fast path: serve the next prefetched question without touching the DB.
+    cache = _Q_CACHE.get(guild_id)
+    if cache:
+        return cache.popleft()
+
     async with _question_lock:
+        # Another round may have refilled the cache while we waited.
+        cache = _Q_CACHE.get(guild_id)
+        if cache:
+            return cache.popleft()
+
         pool = await get_pool()
         async with pool.acquire() as conn:
             async with conn.transaction():
 
-                # Step 1: try unused question
-                row = await conn.fetchrow(
-                    _SQL_PICK_UNUSED,
+                # Step 1: grab a batch of unused questions in one round-trip
+                rows = await conn.fetch(
+                    _SQL_PICK_UNUSED_BATCH,
                     guild_id,
+                    PREFETCH_BATCH,
                 )
 
-                # Step 2: fallback to any question
-                if not row:
+                # Step 2: fallback to any question (one at a time, so a
+                # recycled question isn't served twice back-to-back)
+                if not rows:
                     row = await conn.fetchrow(_SQL_PICK_ANY)
+                    rows = [row] if row else []
 
-                if not row:
+                if not rows:
                     return None
 
-                qid = row["id"]
+                qids = [r["id"] for r in rows]
 
-                await conn.execute(_SQL_INCREMENT_GLOBAL, qid)
-                await conn.execute(
+                await conn.execute(_SQL_INCREMENT_GLOBAL_MANY, qids)
+                await conn.executemany(
                     _SQL_INCREMENT_GUILD,
-                    guild_id,
-                    qid,
+                    [(guild_id, qid) for qid in qids],
                 )
 
-    return {
-        "id": qid,
-        "question": row["question"],
-        "answers": _parse_answers(row["correct_answers"]),
-    }
+        questions: Deque[Question] = deque(
+            {
+                "id": r["id"],
+                "question": r["question"],
+                "answers": _parse_answers(r["correct_answers"]),
+            }
+            for r in rows
+        )
+        _Q_CACHE[guild_id] = questions
+        return questions.popleft()
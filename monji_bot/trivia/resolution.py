@@ -8,7 +8,7 @@ from monji_bot.trivia.constants import WINNER_RESOLUTION_DELAY, ROUND_TRANSITION
 from monji_bot.trivia.lifecycle import ask_next_round, end_game
 from monji_bot.llm.commentary import handle_midgame_quip
 from monji_bot.common.state import GameState
-from monji_bot.db import award_points
+from monji_bot.db import queue_points
 
 
 async def resolve_round_winner(
@@ -33,32 +33,29 @@ async def resolve_round_winner(
         state.resolving = False
         return
 
-    candidates = state.correct_candidates
-
     # No correct answers after all
-    if not candidates:
+    if state.earliest_correct is None:
         state.resolving = False
         return
 
-    # Pick earliest correct answer
-    winner_entry = min(
-        candidates,
-        key=lambda c: c.message.created_at.timestamp(),
-    )
-
-    winner_msg: discord.Message = winner_entry.message
+    # on_message already kept the earliest correct answer
+    winner_msg: discord.Message = state.earliest_correct
     winner_user = winner_msg.author
     winner_id = winner_user.id
 
-    # Mark resolved
+    # Mark resolved, and put the hint cycle out of its misery now instead
+    # of letting it discover the winner after its next sleep.
     state.winner_id = winner_id
+    if state.hint_task is not None and not state.hint_task.done():
+        state.hint_task.cancel()
 
-    # Update in-memory score
-    state.scores[winner_id] = state.scores.get(winner_id, 0) + 1
+    # Update in-memory score (Counter: missing keys default to 0)
+    state.scores[winner_id] += 1
 
-    # Persist leaderboard score
+    # Queue the leaderboard point; the batch is flushed when the game ends,
+    # so the winner announcement isn't stuck behind a DB round-trip.
     if winner_msg.guild is not None:
-        await award_points(
+        queue_points(
             guild_id=winner_msg.guild.id,
             user_id=winner_id,
             display_name=winner_user.display_name,
@@ -70,7 +67,10 @@ async def resolve_round_winner(
         correct_answer = state.current_question["answers"][0]
     else:  # scramble
         correct_answer = state.current_question["word"]
-    await channel.send(
+
+    # Folded into the next round's message (one send per transition)
+    # unless the game is over, in which case it goes out on its own.
+    winner_line = (
         f"✅ {winner_user.mention} got it right. "
         f"Correct answer: **{correct_answer}**."
     )
@@ -88,19 +88,20 @@ async def resolve_round_winner(
     # --- end mid-game quip trigger ---
 
     # Clear round state
-    state.correct_candidates.clear()
+    state.earliest_correct = None
     state.resolving = False
 
     await asyncio.sleep(ROUND_TRANSITION_DELAY)
 
     if state.round >= state.max_rounds:
+        await channel.send(winner_line)
         if state.mode == MODE_TRIVIA:
             await end_game(channel, state)
         else:  # scramble
             await end_scramble_game(channel, state)
     else:
         if state.mode == MODE_TRIVIA:
-            await ask_next_round(channel, state)
+            await ask_next_round(channel, state, pre_text=winner_line)
         else:  # scramble
-            await ask_next_scramble_round(channel, state)
+            await ask_next_scramble_round(channel, state, pre_text=winner_line)
 
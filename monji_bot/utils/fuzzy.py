@@ -1,4 +1,15 @@
+import re
+import threading
+from array import array
 from difflib import SequenceMatcher
+from typing import Optional
+
+# Optional C-backed accelerator; the pure-Python rolling-row DP below is
+# the fallback when it isn't installed.
+try:
+    from rapidfuzz.distance import Levenshtein as _RFLevenshtein
+except ImportError:
+    _RFLevenshtein = None
 
 # Very small set of “useless” words that should not count as an answer by themselves
 STOPWORDS = {
@@ -16,12 +27,14 @@ STOPWORDS = {
 }
 
 
+# Deletes all basic punctuation in one translate() pass instead of one
+# string copy per character.
+_PUNCT_TBL = str.maketrans("", "", ".,!?:;\"'’()[]-")
+
+
 def normalize(text: str) -> str:
     """Lowercase, strip spaces, remove basic punctuation."""
-    text = text.strip().lower()
-    for ch in [".", ",", "!", "?", ":", ";", "\"", "'", "’", "(", ")", "[", "]", "-"]:
-        text = text.replace(ch, "")
-    return " ".join(text.split())
+    return " ".join(text.translate(_PUNCT_TBL).casefold().split())
 
 
 def is_numeric(text: str) -> bool:
@@ -35,17 +48,128 @@ def all_numeric(answers) -> bool:
     return all(is_numeric(a) for a in answers)
 
 
+# Hard ceiling on the edit budget regardless of answer length: with k
+# capped, the banded distance runs in O(k·n) and a long answer can't buy
+# itself a sloppy third typo.
+MAX_EDITS = 2
+
+# Rolling DP rows reused across calls (thread-local: answer checks may run
+# on a worker thread when the alias list is long).
+_DP_ROWS = threading.local()
+
+
+def _edit_distance_within(a: str, b: str, k: int) -> bool:
+    """
+    Return True if the Levenshtein distance between `a` and `b` is <= k.
+
+    Uses two reusable rolling rows instead of a full matrix, and gives up
+    as soon as every cell in a row exceeds k (the distance can only grow).
+    """
+    la, lb = len(a), len(b)
+
+    if abs(la - lb) > k:
+        return False
+
+    if _RFLevenshtein is not None:
+        # score_cutoff lets the C implementation bail out early too.
+        return _RFLevenshtein.distance(a, b, score_cutoff=k) <= k
+
+    # Shared prefix/suffix contributes nothing to the distance; trimming
+    # it shrinks the DP to just the differing core (rapidfuzz does the
+    # same internally, so only the fallback needs it).
+    i = 0
+    lim = min(la, lb)
+    while i < lim and a[i] == b[i]:
+        i += 1
+    j = 0
+    lim -= i
+    while j < lim and a[la - 1 - j] == b[lb - 1 - j]:
+        j += 1
+    if i or j:
+        a = a[i:la - j]
+        b = b[i:lb - j]
+        la -= i + j
+        lb -= i + j
+        if not lb or not la:
+            return max(la, lb) <= k
+
+    # Keep the inner row on the shorter string.
+    if lb > la:
+        a, b = b, a
+        la, lb = lb, la
+
+    rows = getattr(_DP_ROWS, "rows", None)
+    if rows is None or len(rows[0]) < lb + 1:
+        size = max(lb + 1, 64)
+        rows = (array("i", [0] * size), array("i", [0] * size))
+        _DP_ROWS.rows = rows
+
+    prev, curr = rows
+    for j in range(lb + 1):
+        prev[j] = j
+
+    for i in range(1, la + 1):
+        curr[0] = i
+        row_min = i
+        ai = a[i - 1]
+
+        for j in range(1, lb + 1):
+            cost = 0 if ai == b[j - 1] else 1
+            v = prev[j - 1] + cost
+            up = prev[j] + 1
+            if up < v:
+                v = up
+            left = curr[j - 1] + 1
+            if left < v:
+                v = left
+            curr[j] = v
+            if v < row_min:
+                row_min = v
+
+        if row_min > k:
+            return False
+
+        prev, curr = curr, prev
+
+    return prev[lb] <= k
+
+
+def prepare_answers(answers) -> list:
+    """Normalize a question's accepted answers once, at round setup."""
+    return [normalize(a) for a in answers]
+
+
+def compile_exact_answers(normalized_answers) -> Optional[re.Pattern]:
+    """
+    Compile an alternation over the normalized answers for the exact-match
+    fast path: one C-level regex pass instead of a Python loop per candidate.
+    """
+    pattern = "|".join(re.escape(a) for a in normalized_answers if a)
+    if not pattern:
+        return None
+    return re.compile(rf"^(?:{pattern})$")
+
+
 def is_fuzzy_match(user_answer: str, correct_answer: str, threshold: float = 0.9) -> bool:
     """
     Return True if the user's answer is 'close enough' to the correct answer.
     Used for free-text trivia answers.
     """
-    ua = normalize(user_answer)
-    ca = normalize(correct_answer)
+    return is_fuzzy_match_prepared(normalize(user_answer), normalize(correct_answer), threshold)
+
 
+def is_fuzzy_match_prepared(ua: str, ca: str, threshold: float = 0.9) -> bool:
+    """Fuzzy match on strings that have already been through normalize()."""
     if not ua or not ca:
         return False
 
+    # A big length gap can never fuzzy-match (Levenshtein loses all
+    # discrimination there), so drop paragraph-length chat spam in O(1)
+    # before splitting or comparing anything.
+    la, lb = len(ua), len(ca)
+    if max(la, lb) > 3 * min(la, lb):
+        return False
+
     ua_tokens = ua.split()
     ca_tokens = ca.split()
     multi_word_correct = len(ca_tokens) > 1
@@ -70,29 +194,39 @@ def is_fuzzy_match(user_answer: str, correct_answer: str, threshold: float = 0.9
     # SINGLE-WORD ANSWERS (FUZZY BUT STRICT)
     # -----------------------------
     # Very short answers (<= 4 letters)
-    if len(ca) <= 4:
-        if ua[0] != ca[0]:
+    if lb <= 4:
+        # ratio >= 0.9 is unreachable for <= 4-letter answers unless the
+        # lengths match exactly, so bail before touching SequenceMatcher.
+        if la != lb or ua[0] != ca[0]:
             return False
         ratio = SequenceMatcher(None, ua, ca).ratio()
         return ratio >= 0.9
 
-    # Longer single-word answers
-    if abs(len(ua) - len(ca)) > 2:
+    # Longer single-word answers. Derive the edit budget first (0.9 →
+    # ~1 edit per 10 chars) so the length gap can be checked against the
+    # real cutoff instead of a fixed constant — anything wider can never
+    # fit inside k edits, so reject before the distance call.
+    k = min(MAX_EDITS, max(1, round((1 - threshold) * lb)))
+    if abs(la - lb) > k:
         return False
 
     if ua[0] != ca[0] and ua[-1] != ca[-1]:
         return False
 
-    ratio = SequenceMatcher(None, ua, ca).ratio()
-    return ratio >= threshold
+    return _edit_distance_within(ua, ca, k)
 
 
-def is_correct_answer(user_answer: str, correct_answers) -> bool:
+def is_correct_answer(user_answer: str, correct_answers, normalized_answers=None, exact_re=None) -> bool:
     """
     Determines correctness:
       - If all answers are numeric → exact match only.
       - If all answers are single characters → exact match only.
       - Otherwise → fuzzy/text match.
+
+    `normalized_answers` is the output of prepare_answers(); pass it when the
+    question is long-lived so normalization isn't redone per message.
+    `exact_re` is the output of compile_exact_answers(); when given, exact
+    matches short-circuit before any per-candidate fuzzy work.
     """
     user_answer = user_answer.strip()
 
@@ -113,9 +247,17 @@ def is_correct_answer(user_answer: str, correct_answers) -> bool:
         normalized_correct = [a.strip().lower() for a in correct_answers]
         return normalized_user in normalized_correct
 
-    # TEXT MODE
-    for ca in correct_answers:
-        if is_fuzzy_match(user_answer, ca):
+    # TEXT MODE — normalize the user's message once, not per candidate
+    ua = normalize(user_answer)
+
+    if exact_re is not None and exact_re.match(ua):
+        return True
+
+    if normalized_answers is None:
+        normalized_answers = prepare_answers(correct_answers)
+
+    for ca in normalized_answers:
+        if is_fuzzy_match_prepared(ua, ca):
             return True
 
     return False